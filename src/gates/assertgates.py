@@ -4,7 +4,8 @@ This module provides access to assert operations on wires.
 Assert operations ensure that certain properties hold. That is, if the wires do not satisfy the assertion, the circuit
 cannot be verified.
 """
-from typing import List
+import itertools
+from typing import Iterable, List
 
 import src.gates.bits as bitgates
 from src.groups.group import Group
@@ -32,6 +33,32 @@ def assert_equal(group: Group, wires_one: List[Wire], wires_two: List[Wire]) ->
         raise ValueError('Equality does not hold.')
 
 
+def assert_product(group: Group, wire_a: Wire, wire_b: Wire, wire_c: Wire) -> None:
+    """
+    Asserts that the product of the values of the first two wires equals
+    the value of the third wire.
+
+    The assertion is a single multiplication constraint
+    :math:`a \\cdot b = c`, no wire is allocated for the product.
+
+    :param group: The group used for the wires.
+    :type group: Group
+    :param wire_a: First factor (plain integers are treated as
+        constants).
+    :type wire_a: Wire
+    :param wire_b: Second factor (plain integers are treated as
+        constants).
+    :type wire_b: Wire
+    :param wire_c: Expected product.
+    :type wire_c: Wire
+    :raises ValueError: Raised if the product does not hold.
+    """
+    if not (getattr(wire_a, 'is_const', True) or getattr(wire_b, 'is_const', True)):
+        Wire.n_mul += 1
+    if (int(wire_a) * int(wire_b) - int(wire_c)) % group.modulus != 0:
+        raise ValueError('Product does not hold.')
+
+
 def assert_bit(wire: Wire) -> None:
     """
     Asserts that the value of the wire is binary.
@@ -47,6 +74,43 @@ def assert_bit(wire: Wire) -> None:
         raise ValueError('Value of the wire is not a bit.')
 
 
+def assert_bits(group: Group, wires: Iterable[Wire]) -> None:
+    """
+    Asserts that the values of all wires are binary.
+
+    Within the scope of a circuit (see :meth:`Group.circuit`), wires
+    that are already known to be binary are not asserted again.
+
+    :param group: The group used for the wires.
+    :type group: Group
+    :param wires: The wires with expected binary values.
+    :type wires: Iterable[Wire]
+    :raises ValueError: Raised if the value of a wire is not 0 or 1.
+    """
+    for wire in wires:
+        if not group.known_bit(wire):
+            assert_bit(wire)
+            group.mark_bit(wire)
+
+
+def assert_row_stochastic_bit_matrix(group: Group, matrix: List[List[Wire]]) -> None:
+    """
+    Asserts that all values of the matrix are binary and that each row
+    contains exactly one one.
+
+    :param group: The group used for the wires.
+    :type group: Group
+    :param matrix: The matrix of wires (list of rows).
+    :type matrix: List[List[Wire]]
+    :raises ValueError: Raised if a value is not 0 or 1 or if a row
+        does not sum up to 1.
+    """
+    assert_bits(group, itertools.chain.from_iterable(matrix))
+    one = group.gen(1)
+    for row in matrix:
+        assert_equal(group, [group.linear_combination(row, [1] * len(row))], [one])
+
+
 def assert_one_zero_minus_one(wire: Wire) -> None:
     """
     Asserts that the value on the wire is -1 or 0 or 1.
@@ -19,7 +19,9 @@ def split(group: Group, wire: Wire, bit_length: int = None) -> List[Wire]:
     The function computes a list of wires containing the bit
     representation of the input wire. The ordering of the list in
     big-endian, that is the least significant bit is the last element
-    in the list.
+    in the list. If the same wire was already split with the same bit
+    length in the current circuit (see :meth:`Group.circuit`), the
+    existing bits are returned and no constraints are added.
 
     :param group: The group used for the wires.
     :type group: Group
@@ -35,6 +37,9 @@ def split(group: Group, wire: Wire, bit_length: int = None) -> List[Wire]:
     """
     if bit_length is None:
         bit_length = group.bit_length
+    cached_bit_wires = group.cached_split(wire, bit_length)
+    if cached_bit_wires is not None:
+        return cached_bit_wires
     input_val = int(wire)
     bits = bin(input_val)[2:].zfill(bit_length)
     bit_values_sum = 0
@@ -47,9 +52,41 @@ def split(group: Group, wire: Wire, bit_length: int = None) -> List[Wire]:
     assertgates.assert_equal(group, [bit_values_sum], [wire])
     for bit_wire in bit_wires:
         assertgates.assert_bit(bit_wire)
+        group.mark_bit(bit_wire)
+    group.cache_split(wire, bit_length, bit_wires)
     return bit_wires
 
 
+def one_hot(group: Group, bit_wires: List[Wire]) -> List[Wire]:
+    """
+    Computes the one-hot encoding of the value given in binary
+    representation (MSB ordering).
+
+    The function outputs a list of :math:`2^n` wires, where :math:`n`
+    is the number of input wires, in which only the wire at the index
+    of the value has value 1.
+
+    Warning: The output might be incorrect if the input wires are not
+    binary.
+
+    :param group: The group used for the wires.
+    :type group: Group
+    :param bit_wires: The bits of the value (MSB ordering).
+    :type bit_wires: List[Wire]
+    :return: List of wires with value 1 at the index of the value and
+        value 0 otherwise.
+    :rtype: List[Wire]
+    """
+    selectors = [1]
+    for bit_wire in bit_wires:
+        next_selectors = []
+        for selector in selectors:
+            selector_bit = selector * bit_wire
+            next_selectors += [selector - selector_bit, selector_bit]
+        selectors = next_selectors
+    return selectors
+
+
 def verify_bit(group: Group, wire: Wire) -> Wire:
     """
     Verifies that the value of the wire is binary.
@@ -1,6 +1,8 @@
 """
 This module provides access to branching operations.
 """
+from typing import Tuple
+
 from src.groups.wiregroup import Wire
 
 
@@ -44,3 +46,25 @@ def if_then_set_zero(condition_wire: Wire, input_wire: Wire) -> Wire:
     :rtype: Wire
     """
     return (1 - condition_wire) * input_wire
+
+
+def cswap(condition_wire: Wire, wire_one: Wire, wire_two: Wire) -> Tuple[Wire, Wire]:
+    """
+    Evaluates a conditional swap.
+
+    If *condition_wire* has value :math:`1` the values of the wires are
+    swapped, otherwise if *condition_wire* has value :math:`0`, the
+    values are passed through unchanged.
+
+    :param condition_wire: The condition wire. Value on the wire hast to be
+        :math:`0` or :math:`1`.
+    :type condition_wire: Wire
+    :param wire_one: First input wire.
+    :type wire_one: Wire
+    :param wire_two: Second input wire.
+    :type wire_two: Wire
+    :return: The two wires, swapped if *condition* holds.
+    :rtype: Tuple[Wire, Wire]
+    """
+    diff_wire = condition_wire * (wire_one - wire_two)
+    return wire_one - diff_wire, wire_two + diff_wire
@@ -29,6 +29,29 @@ def eq(group: Group, wire_one: Wire, wire_two: Wire) -> Wire:
     return eq_zero(group, wire_one - wire_two)
 
 
+def eq_const(group: Group, wire: Wire, value: int) -> Wire:
+    """
+    Checks whether the value on the wire equals a constant.
+
+    In contrast to :func:`eq`, the constant is not given as a wire but
+    is added as a coefficient of the subtraction.
+
+    :param group: The group used for the wires.
+    :type group: Group
+    :param wire: Wire to compare to the constant. A plain integer is
+        treated as a constant wire.
+    :type wire: Wire
+    :param value: The constant.
+    :type value: int
+    :return: Wire with value one if the input wire has the value of
+        the constant, and wire with value 0 otherwise.
+    :rtype: Wire
+    """
+    if not isinstance(wire, Wire):
+        wire = group.gen(int(wire), is_const=True)
+    return eq_zero(group, wire + (-int(value)))
+
+
 def eq_multiple(group: Group, wires_one: List[Wire], wires_two: List[Wire]) -> Wire:
     """
     Checks the equality of the sum of the values on the wires in the
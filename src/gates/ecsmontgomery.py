@@ -2,7 +2,8 @@
 This module provides access to elliptic curve operations over
 Montgomery curves.
 """
-from typing import Tuple
+import functools
+from typing import List, Tuple
 
 import src.gates.arithmetic as arithmetic
 import src.gates.bits as bitgates
@@ -172,20 +173,131 @@ def ladder(k_bits: int, p: HomogeneousPoint, A: Wire) -> Tuple[HomogeneousPoint,
     r0 = HomogeneousPoint(p.x, None, p.z)
     r1 = xdbl(p, A)
     for i in k_bits[1:]:
-        padd = xadd(r1, r0, p)
-        r0_0 = xdbl(r0, A)
-        r1_1 = xdbl(r1, A)
-
-        ipaddx = i * padd.x
-        ipaddz = i * padd.z
-        r0.x = ipaddx + (1 - i) * r0_0.x
-        r0.z = ipaddz + (1 - i) * r0_0.z
-        r1.x = i * r1_1.x + padd.x - ipaddx
-        r1.z = i * r1_1.z + padd.z - ipaddz
+        ladder_step(i, r0, r1, p, A)
 
     return r0, r1
 
 
+def ladder_step(i: Wire, r0: HomogeneousPoint, r1: HomogeneousPoint, p: HomogeneousPoint, A: Wire) -> None:
+    """
+    A single step of the Montgomery ladder. The points r0 and r1 are
+    updated in place.
+
+    :param i: The current bit of the exponent.
+    :type i: Wire
+    :param r0: HomogeneousPoint r0 of the ladder.
+    :type r0: HomogeneousPoint
+    :param r1: HomogeneousPoint r1 of the ladder.
+    :type r1: HomogeneousPoint
+    :param p: HomogeneousPoint p, i.e., :math:`r1 \ominus r0`.
+    :type p: HomogeneousPoint
+    :param A: curve parameter A.
+    :type A: Wire
+    """
+    padd = xadd(r1, r0, p)
+    r0_0 = xdbl(r0, A)
+    r1_1 = xdbl(r1, A)
+
+    ipaddx = i * padd.x
+    ipaddz = i * padd.z
+    r0.x = ipaddx + (1 - i) * r0_0.x
+    r0.z = ipaddz + (1 - i) * r0_0.z
+    r1.x = i * r1_1.x + padd.x - ipaddx
+    r1.z = i * r1_1.z + padd.z - ipaddz
+
+
+def ladder_uniform(k_bits: int, p: HomogeneousPoint, A: Wire) -> Tuple[HomogeneousPoint, HomogeneousPoint]:
+    """
+    The Montgomery ladder with conditional swaps.
+
+    Each step consists of a conditional swap, one xadd and one xdbl,
+    such that the same operations are performed for every bit.
+
+    :param k_bits: bits of k as list, MSB, first bit is assumed to be
+        1.
+    :type k_bits: int
+    :param p: HomogeneousPoint p.
+    :type p: HomogeneousPoint
+    :param A: curve parameter A.
+    :type A: Wire
+    :return: :math:`[k]\cdot P` in homogeneous coordinates: (x, None,
+           z), (x+1, None, z+1)
+    :rtype: Tuple[HomogeneousPoint, HomogeneousPoint]
+    """
+    return ladder_multiple_points(k_bits, [p], A)[0]
+
+
+def ladder_multiple_points(k_bits: int, ps: List[HomogeneousPoint], A: Wire) -> List[Tuple[HomogeneousPoint, HomogeneousPoint]]:
+    """
+    The Montgomery ladder with conditional swaps for several points
+    sharing the same exponent.
+
+    All ladders are advanced in a single pass over the bits of k and
+    share the swap conditions.
+
+    :param k_bits: bits of k as list, MSB, first bit is assumed to be
+        1.
+    :type k_bits: int
+    :param ps: HomogeneousPoints p.
+    :type ps: List[HomogeneousPoint]
+    :param A: curve parameter A.
+    :type A: Wire
+    :return: :math:`[k]\cdot P` in homogeneous coordinates: (x, None,
+           z), (x+1, None, z+1) for each point P in ps
+    :rtype: List[Tuple[HomogeneousPoint, HomogeneousPoint]]
+    """
+    rs = [(HomogeneousPoint(p.x, None, p.z), xdbl(p, A)) for p in ps]
+    # the first bit is 1, hence, r0 and r1 are not swapped
+    prev_bit = 0
+    for i in k_bits[1:]:
+        # swap only if the bit differs from the previous one
+        swap = prev_bit + i - 2 * prev_bit * i
+        rs = [ladder_uniform_step(swap, r0, r1, p, A) for (r0, r1), p in zip(rs, ps)]
+        prev_bit = i
+
+    return [cswap_points(prev_bit, r0, r1) for r0, r1 in rs]
+
+
+def ladder_uniform_step(swap: Wire, r0: HomogeneousPoint, r1: HomogeneousPoint, p: HomogeneousPoint, A: Wire) -> Tuple[HomogeneousPoint, HomogeneousPoint]:
+    """
+    A single step of the Montgomery ladder with conditional swaps.
+
+    :param swap: Whether the points are to be swapped before the step.
+    :type swap: Wire
+    :param r0: HomogeneousPoint r0 of the ladder.
+    :type r0: HomogeneousPoint
+    :param r1: HomogeneousPoint r1 of the ladder.
+    :type r1: HomogeneousPoint
+    :param p: HomogeneousPoint p, i.e., :math:`\pm (r1 \ominus r0)`.
+    :type p: HomogeneousPoint
+    :param A: curve parameter A.
+    :type A: Wire
+    :return: The updated points r0 and r1.
+    :rtype: Tuple[HomogeneousPoint, HomogeneousPoint]
+    """
+    r0, r1 = cswap_points(swap, r0, r1)
+    return xdbl(r0, A), xadd(r1, r0, p)
+
+
+def cswap_points(swap: Wire, p: HomogeneousPoint, q: HomogeneousPoint) -> Tuple[HomogeneousPoint, HomogeneousPoint]:
+    """
+    Swaps the x- and z-coordinates of the points if *swap* has value 1.
+
+    :param swap: The condition wire.
+    :type swap: Wire
+    :param p: HomogeneousPoint p.
+    :type p: HomogeneousPoint
+    :param q: HomogeneousPoint q.
+    :type q: HomogeneousPoint
+    :return: The points q and p if *swap* has value 1, and p and q
+        otherwise.
+    :rtype: Tuple[HomogeneousPoint, HomogeneousPoint]
+    """
+    px, qx = branching.cswap(swap, p.x, q.x)
+    pz, qz = branching.cswap(swap, p.z, q.z)
+    return HomogeneousPoint(px, None, pz), HomogeneousPoint(qx, None, qz)
+
+
 def xadd_affine(p: AffinePoint, q: AffinePoint, m: AffinePoint) -> AffinePoint:
     """
     Performs a xadd operation as defined over Montgomery curves.
@@ -419,6 +531,87 @@ def add_homogeneous_points(group: Group, A: Wire, B: Wire, p: HomogeneousPoint,
     return pq
 
 
+def add_homogeneous_points_complete(group: Group, A: Wire, B: Wire, p: HomogeneousPoint, q: HomogeneousPoint) -> HomogeneousPoint:
+    """
+    Computes the sum of the points P and Q using the complete addition
+    formulas of Renes, Costello and Batina (Algorithm 1 of "Complete
+    addition formulas for prime order elliptic curves", 2015).
+
+    The points are mapped to the short Weierstrass form of the curve,
+    added, and mapped back. The formulas have no exceptional cases for
+    points of odd order, i.e., P = Q and the point at infinity (0, 1,
+    0) need no special treatment. They must not be used if P - Q is a
+    point of order two. A and B are the constant curve parameters.
+
+    :param group: The group used for the wires.
+    :type group: Group
+    :param A: Montgomery curve parameter.
+    :type A: Wire
+    :param B: Montgomery curve parameter.
+    :type B: Wire
+    :param p: HomogeneousPoint p.
+    :type p: HomogeneousPoint
+    :param q: HomogeneousPoint q.
+    :type q: HomogeneousPoint
+    :return: HomogeneousPoint (x, y, z) of point P+Q.
+    :rtype: HomogeneousPoint
+    """
+    modulus = group.modulus
+    A_val = int(A)
+    B_val = int(B)
+    # y^2 = x^3 + a*x + b with x = u/B + A/(3B) and y = v/B
+    a = group.gen((3 - A_val * A_val) * pow(3 * B_val * B_val, -1, modulus) % modulus, is_const=True)
+    b3 = group.gen((2 * A_val**3 - 9 * A_val) * pow(9 * B_val**3, -1, modulus) % modulus, is_const=True)
+    A_const = group.gen(A_val, is_const=True)
+    B3_const = group.gen(3 * B_val % modulus, is_const=True)
+
+    X1, Y1, Z1 = 3 * p.x + p.z * A_const, 3 * p.y, p.z * B3_const
+    X2, Y2, Z2 = 3 * q.x + q.z * A_const, 3 * q.y, q.z * B3_const
+
+    t0 = X1 * X2
+    t1 = Y1 * Y2
+    t2 = Z1 * Z2
+    t3 = X1 + Y1
+    t4 = X2 + Y2
+    t3 = t3 * t4
+    t4 = t0 + t1
+    t3 = t3 - t4
+    t4 = X1 + Z1
+    t5 = X2 + Z2
+    t4 = t4 * t5
+    t5 = t0 + t2
+    t4 = t4 - t5
+    t5 = Y1 + Z1
+    X3 = Y2 + Z2
+    t5 = t5 * X3
+    X3 = t1 + t2
+    t5 = t5 - X3
+    Z3 = t4 * a
+    X3 = t2 * b3
+    Z3 = X3 + Z3
+    X3 = t1 - Z3
+    Z3 = t1 + Z3
+    Y3 = X3 * Z3
+    t1 = t0 + t0
+    t1 = t1 + t0
+    t2 = t2 * a
+    t4 = t4 * b3
+    t1 = t1 + t2
+    t2 = t0 - t2
+    t2 = t2 * a
+    t4 = t4 + t2
+    t0 = t1 * t4
+    Y3 = Y3 + t0
+    t0 = t5 * t4
+    X3 = t3 * X3
+    X3 = X3 - t0
+    t0 = t3 * t1
+    Z3 = t5 * Z3
+    Z3 = Z3 + t0
+
+    return HomogeneousPoint(X3 * B3_const - Z3 * A_const, Y3 * B3_const, 3 * Z3)
+
+
 def convert_homogeneous_to_affine_coordinates(group: Group, p: HomogeneousPoint) -> AffinePoint:
     """
     Converts homogeneous coordinates to affine coordinates.
@@ -484,6 +677,83 @@ def exponent_homogeneous_point_bit_exponent(g: Group, A: Wire, B: Wire, p: Homog
 
     """
     pe0, pe1 = ladder(exponent_bits, p, A)
+    return ladder_result_to_point(g, A, B, p, pe0, pe1, exponent_bits)
+
+
+def exponent_homogeneous_point_bit_exponent_uniform(g: Group, A: Wire, B: Wire, p: HomogeneousPoint, exponent_bits: Tuple[Wire]) -> HomogeneousPoint:
+    """
+    Computes the exponentation of an homogeneous curve point using the
+    Montgomery ladder with conditional swaps (see :func:`ladder_uniform`).
+
+    :param g: The underlying group.
+    :type g: Group
+    :param A: Montgomery curve parameter.
+    :type A: Wire
+    :param B: Montgomery curve parameter.
+    :type B: Wire
+    :param p: HomogeneousPoint p.
+    :type p: HomogeneousPoint
+    :param exponent_bits: Wires of the bit representation of the exponent (MSB
+        ordering).
+    :type exponent: [Wire]
+    :return: Wire of the exponentation (x, y, z).
+    :rtype: Wire
+    """
+    pe0, pe1 = ladder_uniform(exponent_bits, p, A)
+    return ladder_result_to_point(g, A, B, p, pe0, pe1, exponent_bits)
+
+
+def exponent_two_points_shared_bit_exponent(g: Group, A: Wire, B: Wire, ps: List[HomogeneousPoint], exponent_bits: Tuple[Wire]) -> Tuple[HomogeneousPoint, ...]:
+    """
+    Computes the exponentation of homogeneous curve points (usually two)
+    with the same exponent.
+
+    All Montgomery ladders (see :func:`ladder_uniform`) are evaluated
+    in a single pass over the exponent bits.
+
+    :param g: The underlying group.
+    :type g: Group
+    :param A: Montgomery curve parameter.
+    :type A: Wire
+    :param B: Montgomery curve parameter.
+    :type B: Wire
+    :param ps: The HomogeneousPoints to be exponentiated.
+    :type ps: List[HomogeneousPoint]
+    :param exponent_bits: Wires of the bit representation of the exponent (MSB
+        ordering).
+    :type exponent: [Wire]
+    :return: Wires of the exponentations (x, y, z) in the order of ps.
+    :rtype: Tuple[HomogeneousPoint, ...]
+    """
+    rs = ladder_multiple_points(exponent_bits, ps, A)
+    return tuple(ladder_result_to_point(g, A, B, p, pe0, pe1, exponent_bits) for p, (pe0, pe1) in zip(ps, rs))
+
+
+def ladder_result_to_point(g: Group, A: Wire, B: Wire, p: HomogeneousPoint, pe0: HomogeneousPoint, pe1: HomogeneousPoint, exponent_bits: Tuple[Wire]) -> HomogeneousPoint:
+    """
+    Computes the full point from the output of the Montgomery ladder.
+
+    Recovers the y-coordinate and handles the cases in which the
+    result is the point at infinity or p is the point (0, 0).
+
+    :param g: The underlying group.
+    :type g: Group
+    :param A: Montgomery curve parameter.
+    :type A: Wire
+    :param B: Montgomery curve parameter.
+    :type B: Wire
+    :param p: HomogeneousPoint p that was exponentiated.
+    :type p: HomogeneousPoint
+    :param pe0: First output of the ladder.
+    :type pe0: HomogeneousPoint
+    :param pe1: Second output of the ladder.
+    :type pe1: HomogeneousPoint
+    :param exponent_bits: Wires of the bit representation of the exponent (MSB
+        ordering).
+    :type exponent: [Wire]
+    :return: Wire of the exponentation (x, y, z).
+    :rtype: Wire
+    """
     pe = y_recovery(g, A, B, p, pe0, pe1)
 
     # check point at infinity
@@ -506,6 +776,212 @@ def exponent_homogeneous_point_bit_exponent(g: Group, A: Wire, B: Wire, p: Homog
 
     return pe
 
+
+def is_constant_point(p: Point) -> bool:
+    """
+    Checks whether all coordinates of the point are constant wires.
+
+    :param p: Point p.
+    :type p: Point
+    :return: True if all coordinates of p are constant wires.
+    :rtype: bool
+    """
+    return all(coordinate.is_const for coordinate in [p.x, p.y, p.z])
+
+
+def comb_precompute(g: Group, A: Wire, B: Wire, p: HomogeneousPoint, n_bits: int, window: int) -> List[List[HomogeneousPoint]]:
+    """
+    Precomputes the table of multiples of a fixed point for
+    :func:`comb_exponent`.
+
+    The table is computed outside of the circuit and its entries are
+    constant wires. Hence, p has to be a constant of the circuit (see
+    :func:`is_constant_point`).
+
+    :param g: The underlying group.
+    :type g: Group
+    :param A: Montgomery curve parameter.
+    :type A: Wire
+    :param B: Montgomery curve parameter.
+    :type B: Wire
+    :param p: HomogeneousPoint p.
+    :type p: HomogeneousPoint
+    :param n_bits: Maximum bit size of the exponents.
+    :type n_bits: int
+    :param window: Number of exponent bits per window.
+    :type window: int
+    :return: For each window (least significant window first) the
+        multiples :math:`[d \cdot 2^{j \cdot window}]\cdot P` for all
+        digits :math:`d < 2^{window}`.
+    :rtype: List[List[HomogeneousPoint]]
+    :raises ValueError: Raised if p is not constant.
+    """
+    if not is_constant_point(p):
+        raise ValueError('Point is not constant.')
+    if int(p.z) == 0:
+        base = None
+    else:
+        z_inv = pow(int(p.z), -1, g.modulus)
+        base = (int(p.x) * z_inv % g.modulus, int(p.y) * z_inv % g.modulus)
+
+    tables = []
+    for multiples in _comb_table_values(g.modulus, int(A), int(B), base, (n_bits + window - 1) // window, window):
+        tables.append([HomogeneousPoint(g.gen(0, is_const=True), g.gen(1, is_const=True), g.gen(0, is_const=True)) if q is None else
+                       HomogeneousPoint(g.gen(q[0], is_const=True), g.gen(q[1], is_const=True), g.gen(1, is_const=True)) for q in multiples])
+    return tables
+
+
+@functools.lru_cache(maxsize=32)
+def _comb_table_values(modulus: int, A: int, B: int, base: Tuple[int, int], n_windows: int, window: int) -> Tuple[Tuple[Tuple[int, int], ...], ...]:
+    """
+    Computes the values of the table of :func:`comb_precompute`. The
+    results of the most recently used points are cached, such that
+    repeated exponentiations of the same point do not recompute the
+    table.
+    """
+    tables = []
+    for _ in range(n_windows):
+        multiples = [None]
+        for _ in range(2**window - 1):
+            multiples.append(_add_point_values(modulus, A, B, multiples[-1], base))
+        tables.append(tuple(multiples))
+        base = _add_point_values(modulus, A, B, multiples[-1], base)
+    return tuple(tables)
+
+
+def comb_exponent(g: Group, A: Wire, B: Wire, base_precomp: List[List[HomogeneousPoint]], exponent_bits: Tuple[Wire], window: int) -> HomogeneousPoint:
+    """
+    Computes the exponentation of a fixed homogeneous curve point.
+
+    The exponent is processed in windows of the given size. For each
+    window the multiple of the point is selected from the precomputed
+    table and added to the result (see
+    :func:`add_homogeneous_points_complete`), hence, no doublings are
+    computed in the circuit. The point has to be of odd order. As in
+    :func:`ladder`, the first bit is assumed to be 1.
+
+    :param g: The underlying group.
+    :type g: Group
+    :param A: Montgomery curve parameter.
+    :type A: Wire
+    :param B: Montgomery curve parameter.
+    :type B: Wire
+    :param base_precomp: Table of multiples of the point as computed by
+        :func:`comb_precompute` with the same window size.
+    :type base_precomp: List[List[HomogeneousPoint]]
+    :param exponent_bits: Wires of the bit representation of the exponent (MSB
+        ordering).
+    :type exponent_bits: [Wire]
+    :param window: Number of exponent bits per window.
+    :type window: int
+    :return: Wire of the exponentation (x, y, z).
+    :rtype: HomogeneousPoint
+    :raises ValueError: Raised if the table is too small for the
+        exponent.
+    """
+    pe = None
+    for entry in comb_window_entries(g, base_precomp, exponent_bits, window):
+        pe = entry if pe is None else add_homogeneous_points_complete(g, A, B, pe, entry)
+    return pe
+
+
+def comb_window_entries(g: Group, base_precomp: List[List[HomogeneousPoint]], exponent_bits: Tuple[Wire], window: int) -> List[HomogeneousPoint]:
+    """
+    Selects for each window of the exponent the multiple of the point
+    from the precomputed table (see :func:`comb_exponent`). The sum of
+    the selected points is the exponentation of the point.
+
+    :param g: The underlying group.
+    :type g: Group
+    :param base_precomp: Table of multiples of the point as computed by
+        :func:`comb_precompute` with the same window size.
+    :type base_precomp: List[List[HomogeneousPoint]]
+    :param exponent_bits: Wires of the bit representation of the exponent (MSB
+        ordering).
+    :type exponent_bits: [Wire]
+    :param window: Number of exponent bits per window.
+    :type window: int
+    :return: The selected points, least significant window first.
+    :rtype: List[HomogeneousPoint]
+    :raises ValueError: Raised if the table is too small for the
+        exponent.
+    """
+    n_windows = (len(exponent_bits) + window - 1) // window
+    if n_windows > len(base_precomp):
+        raise ValueError(f'Table of {len(base_precomp)} windows is too small for {n_windows} windows.')
+
+    bits = [1] + list(exponent_bits[1:])
+    entries = []
+    for j in range(n_windows):
+        window_bits = bits[max(0, len(bits) - (j + 1) * window):len(bits) - j * window]
+        selectors = bitgates.one_hot(g, window_bits)
+        table = base_precomp[j]
+        entries.append(HomogeneousPoint(sum([s * q.x for s, q in zip(selectors, table)]),
+                                        sum([s * q.y for s, q in zip(selectors, table)]),
+                                        sum([s * q.z for s, q in zip(selectors, table)])))
+    return entries
+
+
+def msm_bit(g: Group, A: Wire, B: Wire, bases: List[HomogeneousPoint], scalar_bit_lists: List[Tuple[Wire]], window: int = 4, base_precomps: List[List[List[HomogeneousPoint]]] = None) -> HomogeneousPoint:
+    """
+    Computes the multi-scalar multiplication :math:`\\sum_i [s_i]\\cdot P_i`
+    of fixed homogeneous curve points.
+
+    For each point the multiples are selected from its precomputed
+    table (see :func:`comb_exponent`), and all selected points are
+    added to a single accumulator. The points have to be constants of
+    the circuit and of odd order. As in :func:`ladder`, the first bit
+    of each scalar is assumed to be 1.
+
+    :param g: The underlying group.
+    :type g: Group
+    :param A: Montgomery curve parameter.
+    :type A: Wire
+    :param B: Montgomery curve parameter.
+    :type B: Wire
+    :param bases: The HomogeneousPoints P_i.
+    :type bases: List[HomogeneousPoint]
+    :param scalar_bit_lists: For each point, the wires of the bit
+        representation of its scalar (MSB ordering).
+    :type scalar_bit_lists: List[[Wire]]
+    :param window: Number of scalar bits per window, defaults to 4.
+    :type window: int, optional
+    :param base_precomps: The tables of the points (see
+        :func:`comb_precompute`), computed with the same window. If not
+        given, they are computed from the points.
+    :type base_precomps: List[List[List[HomogeneousPoint]]], optional
+    :return: Wire of the sum (x, y, z).
+    :rtype: HomogeneousPoint
+    """
+    if base_precomps is None:
+        base_precomps = [comb_precompute(g, A, B, base, len(scalar_bits), window) for base, scalar_bits in zip(bases, scalar_bit_lists)]
+    pe = None
+    for base_precomp, scalar_bits in zip(base_precomps, scalar_bit_lists):
+        for entry in comb_window_entries(g, base_precomp, scalar_bits, window):
+            pe = entry if pe is None else add_homogeneous_points_complete(g, A, B, pe, entry)
+    return pe
+
+
+def _add_point_values(modulus: int, A: int, B: int, p: Tuple[int, int], q: Tuple[int, int]) -> Tuple[int, int]:
+    """
+    Adds two affine points given by their values (outside of the
+    circuit). The point at infinity is represented by None.
+    """
+    if p is None:
+        return q
+    if q is None:
+        return p
+    if p[0] == q[0]:
+        if (p[1] + q[1]) % modulus == 0:
+            return None
+        lambda_val = (3 * p[0] * p[0] + 2 * A * p[0] + 1) * pow(2 * B * p[1], -1, modulus)
+    else:
+        lambda_val = (q[1] - p[1]) * pow(q[0] - p[0], -1, modulus)
+    x = (B * lambda_val * lambda_val - A - p[0] - q[0]) % modulus
+    y = (lambda_val * (p[0] - x) - p[1]) % modulus
+    return (x, y)
+
+
 def exponent_homogeneous_point_bit_exponent_without_y_recovery(A: Wire, p: HomogeneousPoint, exponent_bits: Tuple[Wire]) -> HomogeneousPoint:
     """
     Computes the exponentation of an homogeneous curve point (no y-recovery is done here). This is only for debugging purposes.
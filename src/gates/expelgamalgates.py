@@ -8,19 +8,25 @@ import src.gates.ecsmontgomery as montgomery
 from src.groups.group import Group
 from src.groups.wiregroup import Wire
 
-def exponential_elgamal_over_montgomery_curve_bit_randomness(group: Group, A: Wire, B: Wire, g: montgomery.HomogeneousPoint, pk: montgomery.HomogeneousPoint, x: Wire, r_bits: Tuple[Wire], n_max_bits_x: int = None) -> tuple[montgomery.HomogeneousPoint]:
+def exponential_elgamal_over_montgomery_curve_bit_randomness(group: Group, A: Wire, B: Wire, g: montgomery.HomogeneousPoint, pk: montgomery.HomogeneousPoint, x: Wire, r_bits: Tuple[Wire], n_max_bits_x: int = None, window: int = 4) -> tuple[montgomery.HomogeneousPoint]:
     """
     Computes an exponential ElGamal ciphertext over a Montgomery curve.
 
+    Encrypting the same plaintext wire several times (e.g., under
+    different keys) within one circuit reuses its bit decomposition
+    (see :func:`bits.split`).
+
     :param group: The underlying group.
     :type group: Group
     :param A: Montgomery curve parameter.
     :type A: Wire
     :param B: Montgomery curve parameter.
     :type B: Wire
-    :param g: HomogeneousPoint g.
+    :param g: HomogeneousPoint g (of odd order). If its coordinates are
+        constant wires, it is treated as a fixed point.
     :type g: HomogeneousPoint
-    :param pk: public key.
+    :param pk: public key (of odd order). If its coordinates are
+        constant wires, it is treated as a fixed point as well.
     :type pk: HomogeneousPoint
     :param x: Value to commit to.
     :type x: Wire
@@ -30,15 +36,30 @@ def exponential_elgamal_over_montgomery_curve_bit_randomness(group: Group, A: Wi
         size).
     :type n_max_bits_x: int
     :type r_bits: [Wire]
+    :param window: Number of bits per window of the fixed-base
+        exponentiations of g (default: 4).
+    :type window: int
     :return: ciphertext encrypting x with randomness r, both entries in homogeneous coordinates (x, y,
         z).
     :rtype: HomogeneousPoint
     """
     x_bits = bitgates.split(group, x, bit_length=n_max_bits_x)
-    gx = montgomery.exponent_homogeneous_point_bit_exponent(group, A, B, g, x_bits)
-    pkr = montgomery.exponent_homogeneous_point_bit_exponent(group, A, B, pk, r_bits)
-    gr = montgomery.exponent_homogeneous_point_bit_exponent(group,A,B,g,r_bits)
-    c = (gr,montgomery.add_homogeneous_points(group, A, B, gx, pkr))
+    if not montgomery.is_constant_point(g):
+        # g^r and pk^r share the ladder over the bits of r
+        gr, pkr = montgomery.exponent_two_points_shared_bit_exponent(group, A, B, [g, pk], r_bits)
+        gx = montgomery.exponent_homogeneous_point_bit_exponent_uniform(group, A, B, g, x_bits)
+        gxpkr = montgomery.add_homogeneous_points_complete(group, A, B, gx, pkr)
+        return (gr,gxpkr)
+    g_precomp = montgomery.comb_precompute(group, A, B, g, max(len(x_bits), len(r_bits)), window)
+    gr = montgomery.comb_exponent(group, A, B, g_precomp, r_bits, window)
+    if montgomery.is_constant_point(pk):
+        pk_precomp = montgomery.comb_precompute(group, A, B, pk, len(r_bits), window)
+        gxpkr = montgomery.msm_bit(group, A, B, [g, pk], [x_bits, r_bits], window, [g_precomp, pk_precomp])
+    else:
+        gx = montgomery.comb_exponent(group, A, B, g_precomp, x_bits, window)
+        pkr = montgomery.exponent_homogeneous_point_bit_exponent_uniform(group, A, B, pk, r_bits)
+        gxpkr = montgomery.add_homogeneous_points_complete(group, A, B, gx, pkr)
+    c = (gr,gxpkr)
     return c
 
 def exponential_elgamal_over_montgomery_curve(group: Group, A: Wire, B: Wire, g: montgomery.HomogeneousPoint, pk: montgomery.HomogeneousPoint, x: Wire, r: Wire) -> tuple[montgomery.HomogeneousPoint,montgomery.HomogeneousPoint]:
@@ -51,9 +72,10 @@ def exponential_elgamal_over_montgomery_curve(group: Group, A: Wire, B: Wire, g:
     :type A: Wire
     :param B: Montgomery curve parameter.
     :type B: Wire
-    :param g: HomogeneousPoint g.
+    :param g: HomogeneousPoint g (of odd order). If its coordinates are
+        constant wires, it is treated as a fixed point.
     :type g: HomogeneousPoint
-    :param pk: public key.
+    :param pk: public key (of odd order).
     :type pk: HomogeneousPoint
     :param x: Plaintext
     :type x: Wire
@@ -63,8 +85,5 @@ def exponential_elgamal_over_montgomery_curve(group: Group, A: Wire, B: Wire, g:
         z).
     :rtype: tuple[HomogeneousPoint, HomogeneousPoint]
     """
-    gx = montgomery.exponent_homogeneous_point(group, A, B, g, x)
-    pkr = montgomery.exponent_homogeneous_point(group, A, B, pk, r)
-    gr = montgomery.exponent_homogeneous_point(group,A,B,g,r)
-    c = (gr,montgomery.add_homogeneous_points(group, A, B, gx, pkr))
-    return c
+    r_bits = bitgates.split(group, r)
+    return exponential_elgamal_over_montgomery_curve_bit_randomness(group, A, B, g, pk, x, r_bits)
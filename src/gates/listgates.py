@@ -1,7 +1,9 @@
 """
 This module provides access to operations over lists.
 """
-from typing import List
+from typing import List, Tuple
+import src.gates.assertgates as assertgates
+import src.gates.branching as branching
 import src.gates.comparison as comparison
 from src.groups.group import Group
 from src.groups.wiregroup import Wire
@@ -20,8 +22,100 @@ def get_n_occurences(group: Group, wires: List[Wire], wire: Wire) -> Wire:
         the given wire.
     :rtype: Wire
     """
-    n_occurences = group.gen(0)
+    ind_eqs = [comparison.eq(group, wire_in_list, wire) for wire_in_list in wires]
+    return group.linear_combination(ind_eqs, [1] * len(ind_eqs))
+
+
+def get_n_occurences_multi(group: Group, wires: List[Wire], targets: List[Wire]) -> List[Wire]:
+    """
+    Returns how often each of the targets occurs in the list.
+
+    The list is traversed only once and each wire is compared to all
+    targets.
+
+    :param group: The underlying group
+    :type group: Group
+    :param wires: List of wires
+    :type wires: List[Wire]
+    :param targets: The wires with the values to find in the list.
+        Constant targets are compared as constants (see
+        :func:`comparison.eq_const`).
+    :type targets: List[Wire]
+    :return: Returns for each target how many wires in the list have
+        the value of the target.
+    :rtype: List[Wire]
+    """
+    indicators = [[] for _ in targets]
     for wire_in_list in wires:
-        ind_eq = comparison.eq(group, wire_in_list, wire)
-        n_occurences += ind_eq
-    return n_occurences
+        for idx, target in enumerate(targets):
+            if target.is_const:
+                indicators[idx].append(comparison.eq_const(group, wire_in_list, int(target)))
+            else:
+                indicators[idx].append(comparison.eq(group, wire_in_list, target))
+    return [group.linear_combination(ind_eqs, [1] * len(ind_eqs)) for ind_eqs in indicators]
+
+
+def sort_permutation(group: Group, values: List[Wire], bits: int) -> Tuple[List[Wire], List[List[Wire]]]:
+    """
+    Sorts the values in ascending order.
+
+    The sorted list and the permutation are supplied by the prover. The
+    permutation is given as a binary matrix with exactly one one in
+    each row and each column, where the entry in row k and column j is
+    one if the k-th sorted value is the j-th input value.
+
+    :param group: The underlying group
+    :type group: Group
+    :param values: List of wires to be sorted
+    :type values: List[Wire]
+    :param bits: Maximum bit size of the values
+    :type bits: int
+    :return: The sorted list of wires and the permutation matrix.
+    :rtype: Tuple[List[Wire], List[List[Wire]]]
+    :raises ValueError: Raised if the permutation or the ordering does
+        not verify.
+    """
+    n = len(values)
+    order = sorted(range(n), key=lambda j: int(values[j]))
+    permutation = [[group.gen(1 if j == order[k] else 0) for j in range(n)] for k in range(n)]
+
+    one = group.gen(1)
+    for row in permutation:
+        for entry in row:
+            assertgates.assert_bit(entry)
+        assertgates.assert_equal(group, row, [one])
+    for j in range(n):
+        assertgates.assert_equal(group, [row[j] for row in permutation], [one])
+
+    sorted_values = [sum([entry * value for entry, value in zip(row, values)]) for row in permutation]
+    for k in range(n - 1):
+        assertgates.assert_gt(group, sorted_values[k + 1], sorted_values[k], bits)
+    return sorted_values, permutation
+
+
+def get_run_boundaries(group: Group, sorted_wires: List[Wire]) -> Tuple[List[Wire], List[Wire]]:
+    """
+    Returns for each position of a sorted list the first and the last
+    position of the run of equal values it belongs to.
+
+    :param group: The underlying group
+    :type group: Group
+    :param sorted_wires: Sorted list of wires
+    :type sorted_wires: List[Wire]
+    :return: The start positions and the (inclusive) end positions of
+        the runs.
+    :rtype: Tuple[List[Wire], List[Wire]]
+    """
+    n = len(sorted_wires)
+    if n == 0:
+        return [], []
+    ind_eq_prev = [comparison.eq(group, sorted_wires[k], sorted_wires[k - 1]) for k in range(1, n)]
+
+    starts = [group.gen(0)]
+    for k in range(1, n):
+        starts.append(branching.if_then_else(ind_eq_prev[k - 1], starts[-1], k))
+    ends = [group.gen(n - 1)]
+    for k in reversed(range(n - 1)):
+        ends.append(branching.if_then_else(ind_eq_prev[k], ends[-1], k))
+    ends.reverse()
+    return starts, ends
@@ -1,7 +1,6 @@
 """
 Contains evaluation functions for ballot relations.
 """
-import itertools
 from typing import List
 
 import src.gates.assertgates as assertgates
@@ -22,11 +21,10 @@ def assert_single_vote(group: Group, ballot: List[Wire]) -> None:
     :type ballot: List[Wire]
     :raises ValueError: Raised if the ballot does not verify.
     """
-    for wire in ballot:
-        assertgates.assert_bit(wire)
+    assertgates.assert_bits(group, ballot)
     assertgates.assert_equal(group, ballot, [group.gen(1)])
 
-def assert_multi_vote(group: Group, ballot: List[Wire], max_choices: Wire = None, bits: int = 1, max_votes_per_candidate: Wire = None, totalbits: int = None) -> None:
+def assert_multi_vote(group: Group, ballot: List[Wire], max_choices: Wire = None, bits: int = 1, max_votes_per_candidate: Wire = None, totalbits: int = None) -> Wire:
     """
     Asserts that each entry is at most max_votes_per_candidate and that the sum of all entries is at most max_choices. Bits should be at least log(max_votes_per_candidates*num_cand).
 
@@ -41,26 +39,32 @@ def assert_multi_vote(group: Group, ballot: List[Wire], max_choices: Wire = None
         defaults to 1.
     :type bits: int, optional
     :param max_votes_per_candidate: maximum number of votes per candidate, defaults to
-        None (only 0 or 1 vote per candidate). Should not be large than 2^bits-1
+        None (only 0 or 1 vote per candidate). Should not be large than 2^bits-1.
+        If given as int, the entries are checked with its bit size instead of bits.
     :type max_votes_per_candidate: int, optional
     :param totalbits: Maximum bit size of the sum of the ballot entries len(ballot)=numcand.
     :type bits: int, optional
+    :return: The sum of the ballot entries
+    :rtype: Wire
     :raises ValueError: Raised if the ballot does not verify.
     """
-    if max_votes_per_candidate is None:
-        max_votes_per_candidate=group.gen(1)
-    
     if totalbits is None:
         totalbits = len(ballot)
 
-    for wire in ballot:
-        assertgates.assert_gt(group,max_votes_per_candidate,wire,bits)
-    
+    if max_votes_per_candidate is None or (isinstance(max_votes_per_candidate, int) and max_votes_per_candidate == 1):
+        assertgates.assert_bits(group, ballot)
+    else:
+        if isinstance(max_votes_per_candidate, int):
+            bits = max(1, max_votes_per_candidate.bit_length())
+        for wire in ballot:
+            assertgates.assert_gt(group,max_votes_per_candidate,wire,bits)
+
+    n_choices = group.linear_combination(ballot, [1] * len(ballot))
     if max_choices is not None:
-        n_choices = sum(ballot)
         assertgates.assert_gt(group, max_choices, n_choices, totalbits)
+    return n_choices
 
-def assert_multi_vote_with_rules(group: Group, ballot: List[Wire], max_choices: Wire = None, bits: int = 1, max_votes_per_candidate: Wire = None, totalbits: int = None) ->None:
+def assert_multi_vote_with_rules(group: Group, ballot: List[Wire], max_choices: Wire = None, bits: int = 1, max_votes_per_candidate: Wire = None, totalbits: int = None) -> Wire:
 
     """
     Asserts that each entry is at most max_votes_per_candidate, that the sum of all entries is at most max_choices, and that the product of the second and the third ballot entry equals the first ballot entry. 
@@ -80,11 +84,14 @@ def assert_multi_vote_with_rules(group: Group, ballot: List[Wire], max_choices:
     :type max_votes_per_candidate: int, optional
     :param totalbits: Maximum bit size of the sum of the ballot entries len(ballot)=numcand.
     :type bits: int, optional
+    :return: The sum of the ballot entries
+    :rtype: Wire
     :raises ValueError: Raised if the ballot does not verify.
     """
-    assert_multi_vote(group,ballot,max_choices,bits,max_votes_per_candidate,totalbits)
+    n_choices = assert_multi_vote(group,ballot,max_choices,bits,max_votes_per_candidate,totalbits)
     if len(ballot)>2:
-        assertgates.assert_equal(group,[ballot[1]*ballot[2]],[ballot[0]])
+        assertgates.assert_product(group,ballot[1],ballot[2],ballot[0])
+    return n_choices
 
 def assert_line_vote_ballot(group: Group, ballot: List[Wire]) ->None:
     """
@@ -98,11 +105,10 @@ def assert_line_vote_ballot(group: Group, ballot: List[Wire]) ->None:
     :type ballot: List[Wire]
     :raises ValueError: Raised if the ballot does not verify.
     """
-    assertgates.assert_bit(ballot[0])
-    indicator_bit_up=ballot[0]
-    for idx in range(len(ballot)-1):
-        assertgates.assert_bit(ballot[idx+1])
-        indicator_bit_up+=(ballot[idx+1]-ballot[idx])*ballot[idx+1]
+    assertgates.assert_bits(group, ballot)
+    # (b-a)*b == b-a*b for bits a and b
+    terms=[ballot[0]]+[ballot[idx+1]-ballot[idx]*ballot[idx+1] for idx in range(len(ballot)-1)]
+    indicator_bit_up=group.linear_combination(terms,[1]*len(terms))
     assertgates.assert_bit(indicator_bit_up)
 
 
@@ -118,12 +124,11 @@ def assert_pointlist_borda_ballot(group: Group, ballot: List[Wire], ordered_poin
     :type ordered_points: List[Wire]
     :raises ValueError: Raised if the ballot does not verify.
     """
-    expected_zeros=group.gen(len(ballot)-len(ordered_points))
-    num_zeros=listgates.get_n_occurences(group,ballot,group.gen(0))
-    assertgates.assert_equal(group,[expected_zeros],[num_zeros])
-    for point in ordered_points:
-        n_occ = listgates.get_n_occurences(group,ballot,point)
-        assertgates.assert_equal(group,[n_occ],[group.gen(1)])
+    targets = [group.gen(0, is_const=True)] + ordered_points
+    expected = [group.gen(len(ballot)-len(ordered_points))] + [group.gen(1)] * len(ordered_points)
+    n_occs = listgates.get_n_occurences_multi(group,ballot,targets)
+    for n_occ, n_expected in zip(n_occs, expected):
+        assertgates.assert_equal(group,[n_expected],[n_occ])
 
 def compute_borda_tournament_style_ballot(group: Group, ranking: List[Wire], bits: int) -> List[Wire]:
     """
@@ -142,11 +147,18 @@ def compute_borda_tournament_style_ballot(group: Group, ranking: List[Wire], bit
     :return: List of points per choice
     :rtype: List[Wire]
     """
-    points = []
-    for i, ranking_val in enumerate(ranking):
-        n_truely_greater = sum([comparison.gt(group, ranking_val - 1, comp_val, bits) for j, comp_val in enumerate(ranking) if j != i])
-        n_eq = sum([comparison.eq(group, ranking_val, comp_val) for j, comp_val in enumerate(ranking) if j != i])
-        points.append(2 * n_truely_greater + n_eq)
+    n = len(ranking)
+    sorted_ranking, permutation = listgates.sort_permutation(group, ranking, bits)
+    # Within a run of equal values, the first position is the number of
+    # truely smaller values and the distance to the last position is the
+    # number of other equal values.
+    starts, ends = listgates.get_run_boundaries(group, sorted_ranking)
+
+    # Zero is the highest rank, i.e., zeros beat every other choice.
+    ind_zero = [comparison.eq_zero(group, ranking_val) for ranking_val in sorted_ranking]
+
+    sorted_points = [start + end + 2 * (n - 1) * zero for start, end, zero in zip(starts, ends, ind_zero)]
+    points = [sum([permutation[k][i] * sorted_points[k] for k in range(n)]) for i in range(n)]
     return points
 
 def assert_condorcet_ballot(group: Group, ballot: List[List[Wire]]) -> None:
@@ -159,23 +171,28 @@ def assert_condorcet_ballot(group: Group, ballot: List[List[Wire]]) -> None:
     :type ballot: List[List[Wire]]
     :raises ValueError: Raised if the ballot does not verify.
     """
-    for i, row in enumerate(ballot):
-        for j, entry in enumerate(row):
-            if i == j:
+    assertgates.assert_bits(group, [entry for i, row in enumerate(ballot) for j, entry in enumerate(row) if i != j])
+
+    n = len(ballot)
+    zero = group.gen(0)
+    one = group.gen(1)
+    # the pairs are only checked as part of a triple, i.e. for n > 2
+    if n > 2:
+        for i in range(n):
+            for j in range(i + 1, n):
+                assertgates.assert_bit(sum([ballot[i][j], ballot[j][i]]))
+
+    # check_matrix[b][a] = 1 - ballot[b][a]
+    check_matrix = [[one - ballot[b][a] for a in range(n)] for b in range(n)]
+    for i in range(n):
+        for j in range(n):
+            if j == i:
                 continue
-            assertgates.assert_bit(entry)
-
-    for i, j, k in itertools.product(range(len(ballot)), range(len(ballot)), range(len(ballot))):
-        if i == j or i == k or j == k:
-            continue
-        value_i_j = ballot[i][j]
-        value_j_i = ballot[j][i]
-        check_matrix_i_j = group.gen(1)-ballot[j][i]
-        check_matrix_j_k=group.gen(1)-ballot[k][j]
-        check_matrix_i_k=group.gen(1)-ballot[k][i]
-        assertgates.assert_bit(sum([value_i_j,value_j_i]))
-        ind_false = bitgates.and_gate(group,[check_matrix_i_j,check_matrix_j_k,1-check_matrix_i_k])
-        assertgates.assert_equal(group, [ind_false], [group.gen(0)])
+            for k in range(n):
+                if k == i or k == j:
+                    continue
+                ind_false = bitgates.and_gate(group,[check_matrix[j][i],check_matrix[k][j],one-check_matrix[k][i]])
+                assertgates.assert_equal(group, [ind_false], [zero])
 
 def assert_majority_judgment_ballot(group: Group, ballot: List[List[Wire]]) -> None:
     """
@@ -187,6 +204,4 @@ def assert_majority_judgment_ballot(group: Group, ballot: List[List[Wire]]) -> N
     :type ballot: List[List[Wire]]
     :raises ValueError: Raised if the ballot does not verify.
     """
-
-    for row in ballot:
-        assert_single_vote(group,row)
\ No newline at end of file
+    assertgates.assert_row_stochastic_bit_matrix(group, ballot)
@@ -5,6 +5,8 @@ Classes:
 
     Group
 """
+import contextlib
+import weakref
 
 
 class Group():
@@ -13,7 +15,12 @@ class Group():
     """
 
     def __init__(self):
-        pass
+        # group elements known to be binary, keyed by their id (only
+        # within the scope of a circuit, see circuit())
+        self._known_bits = None
+        # bit decompositions, keyed by the id of the element and the bit
+        # length (only within the scope of a circuit, see circuit())
+        self._split_cache = None
 
     @property
     def zero(self):
@@ -35,6 +42,127 @@ class Group():
         """
         return self.gen(1)
 
+    @contextlib.contextmanager
+    def circuit(self):
+        """
+        Scope of a single circuit build.
+
+        Within the scope, the group records which group elements are
+        asserted to be binary (see :meth:`mark_bit`) and the bit
+        decompositions of group elements (see :meth:`cache_split`), such
+        that the assertions are not repeated in the same circuit. The
+        records are dropped when the scope is left. Outside of a scope, nothing is
+        recorded. Nested scopes belong to the outermost circuit.
+
+        :return: The group.
+        :rtype: Group
+        """
+        if self._known_bits is not None:
+            yield self
+            return
+        self._known_bits = weakref.WeakValueDictionary()
+        self._split_cache = {}
+        try:
+            yield self
+        finally:
+            self._known_bits = None
+            self._split_cache = None
+
+    def mark_bit(self, elem) -> None:
+        """
+        Records that the value of the group element is asserted to be
+        binary in the current circuit (see :meth:`circuit`). Elements
+        that cannot be weakly referenced (e.g. plain integers) are not
+        recorded.
+
+        :param elem: Group element with asserted binary value.
+        :type elem: GroupElement
+        """
+        if self._known_bits is None:
+            return
+        try:
+            self._known_bits[id(elem)] = elem
+        except TypeError:
+            pass
+
+    def known_bit(self, elem) -> bool:
+        """
+        Returns whether the value of the group element is already
+        asserted to be binary in the current circuit (see
+        :meth:`circuit`).
+
+        :param elem: Group element.
+        :type elem: GroupElement
+        :return: True if the group element was marked as binary.
+        :rtype: bool
+        """
+        if self._known_bits is None:
+            return False
+        return self._known_bits.get(id(elem)) is elem
+
+    def cache_split(self, elem, bit_length: int, bits) -> None:
+        """
+        Records the bit decomposition of the group element in the
+        current circuit (see :meth:`circuit`). The entry is removed once
+        the group element is garbage collected or its value changes (see
+        :meth:`invalidate_split`). Elements that cannot be weakly
+        referenced (e.g. plain integers) are not recorded.
+
+        :param elem: The decomposed group element.
+        :type elem: GroupElement
+        :param bit_length: The bit length of the decomposition.
+        :type bit_length: int
+        :param bits: The bits of the decomposition.
+        :type bits: List[GroupElement]
+        """
+        if self._split_cache is None:
+            return
+        key = (id(elem), bit_length)
+        split_cache = self._split_cache
+        try:
+            elem_ref = weakref.ref(elem, lambda _: split_cache.pop(key, None))
+        except TypeError:
+            return
+        split_cache[key] = (elem_ref, int(elem), list(bits))
+
+    def cached_split(self, elem, bit_length: int):
+        """
+        Returns the recorded bit decomposition of the group element. A
+        decomposition recorded for a different value of the element is
+        discarded.
+
+        :param elem: The group element.
+        :type elem: GroupElement
+        :param bit_length: The bit length of the decomposition.
+        :type bit_length: int
+        :return: The bits of the decomposition, or None if the group
+            element was not decomposed with the given bit length.
+        :rtype: List[GroupElement]
+        """
+        if self._split_cache is None:
+            return None
+        entry = self._split_cache.get((id(elem), bit_length))
+        if entry is None or entry[0]() is not elem:
+            return None
+        if entry[1] != int(elem):
+            self.invalidate_split(elem)
+            return None
+        return list(entry[2])
+
+    def invalidate_split(self, elem) -> None:
+        """
+        Removes all recorded bit decompositions of the group element.
+        Has to be called if the element is reused for a different value
+        within the same circuit.
+
+        :param elem: The group element.
+        :type elem: GroupElement
+        """
+        if self._split_cache is None:
+            return
+        for key in [key for key in self._split_cache if key[0] == id(elem)]:
+            del self._split_cache[key]
+
     def gen(self, value):
         """
         Returns the group element of given value.
@@ -58,3 +186,17 @@ class Group():
         :raises NotImplementedError: Raises if function is not implemented.
         """
         raise NotImplementedError()
+
+    def linear_combination(self, elems, coefs):
+        """
+        Returns the linear combination of the given group elements.
+
+        :param elems: Group elements.
+        :type elems: List[GroupElement]
+        :param coefs: Coefficient of each group element.
+        :type coefs: List[Numeric]
+        :return: Group element of value :math:`\\sum_i c_i \\cdot e_i`.
+        :rtype: GroupElement
+        :raises NotImplementedError: Raises if function is not implemented.
+        """
+        raise NotImplementedError()
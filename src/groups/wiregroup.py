@@ -7,12 +7,14 @@ class Wire():
     Represents a wire.
     """
 
+    __slots__ = ('value', 'modulus', 'is_const', '__weakref__')
+
     n_mul = 0
     n_wires = 0
 
     @classmethod
     def create(cls, value, modulus, is_const=False) -> 'Wire':
-        residue = Wire()
+        residue = cls.__new__(cls)
         residue.value = value
         residue.modulus = modulus
         residue.is_const = is_const
@@ -101,6 +103,7 @@ class Wire():
 class WireGroup(Group):
 
     def __init__(self, modulus):
+        super().__init__()
         self.modulus = modulus
 
     @property
@@ -123,6 +126,22 @@ class WireGroup(Group):
         """
         return [self.gen(v) for v in values]
 
+    def linear_combination(self, wires: List[Wire], coefs: List[int]) -> Wire:
+        """Computes a linear combination of wires as a single wire.
+
+        :param wires: The list of wires (plain integers are treated as
+            constants)
+        :type wires: List[Wire]
+        :param coefs: The coefficient of each wire
+        :type coefs: List[int]
+        :return: A wire with the value of the sum of the wires weighted
+            by their coefficients.
+        :rtype: Wire
+        """
+        value = sum(int(coef) * int(wire) for wire, coef in zip(wires, coefs)) % self.modulus
+        is_const = all(getattr(wire, 'is_const', True) for wire in wires)
+        return Wire.create(value, self.modulus, is_const=is_const)
+
     def inv(self, x) -> Wire:
         Wire = self.gen(int(x))
         return Wire.invert()